@@ -5,7 +5,7 @@ import re
 
 # Read the API file
 with open('src/api/quantum_api.py', 'r') as f:
-    lines = f.readlines()
+    text = f.read()
 
 # Find the create_bell_state function and replace it
 new_function = '''@app.get("/entanglement/bell_state")
@@ -34,19 +34,18 @@ async def create_bell_state(gate_type: str = 'CNOT'):
             }
         
         print("Creating actual Bell state...")
-        bell_state = EntanglementVerification.create_bell_state(gate_type)
+        verification = _quantum().EntanglementVerification
+        bell_state = verification.create_bell_state(gate_type)
         print(f"Bell state created: {bell_state}")
         
-        concurrence = EntanglementVerification.calculate_concurrence(bell_state)
+        concurrence = verification.calculate_concurrence(bell_state)
         print(f"Concurrence calculated: {concurrence}")
         
-        # Convert to JSON-serializable format
-        state_list = []
-        for i, val in enumerate(bell_state):
-            if hasattr(val, 'real'):
-                state_list.append(float(val.real))
-            else:
-                state_list.append(float(val))
+        # Convert to JSON-serializable format in one numpy pass
+        state_array = np.asarray(bell_state)
+        if np.iscomplexobj(state_array):
+            state_array = state_array.real
+        state_list = state_array.astype(float).tolist()
         
         print("Returning successful response")
         return {
@@ -69,28 +68,18 @@ async def create_bell_state(gate_type: str = 'CNOT'):
             "success": False
         }'''
 
-# Find and replace the function
-in_function = False
-function_start = -1
-function_end = -1
-new_lines = []
-
-for i, line in enumerate(lines):
-    if '@app.get("/entanglement/bell_state")' in line:
-        function_start = i
-        in_function = True
-        # Add the new function
-        new_lines.append(new_function + '\n')
-    elif in_function and line.strip() and not line.startswith(' ') and not line.startswith('@') and i > function_start:
-        # Found the next function, end of current function
-        in_function = False
-    elif not in_function:
-        new_lines.append(line)
+# Match the whole endpoint up to the next top-level statement
+pattern = re.compile(
+    r'@app\.get\("/entanglement/bell_state"\)\s*\nasync def create_bell_state.*?'
+    r'(?=\n\S|\Z)',
+    re.DOTALL
+)
+new_text, count = pattern.subn(lambda _: new_function + '\n', text)
 
 # If we found and replaced the function, write the file
-if function_start != -1:
+if count == 1:
     with open('src/api/quantum_api.py', 'w') as f:
-        f.writelines(new_lines)
+        f.write(new_text)
     print("✅ Successfully replaced entanglement endpoint")
 else:
     print("❌ Could not find entanglement endpoint to replace")
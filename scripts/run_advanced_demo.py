@@ -9,7 +9,7 @@ import logging
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from quantum_control.transmon_qubit import TransmonQubit, QubitSpec
+from quantum_control.transmon_qubit import TransmonQubit, make_default_specs
 from quantum_control.two_qubit_gates import TwoQubitGate, TwoQubitGateSpec, EntanglementVerification
 from cryo_hardware.signal_chain import CryogenicControlSystem
 from quantum_ops.error_correction import QuantumErrorCorrection, QECCode
@@ -26,15 +26,7 @@ def main():
     control_system = CryogenicControlSystem()
     
     # Add multiple qubits
-    for i in range(4):
-        spec = QubitSpec(
-            frequency=5.0 + i * 0.1,
-            anharmonicity=-0.3,
-            t1=10000,
-            t2=5000,
-            readout_frequency=6.5 + i * 0.05,
-            readout_amplitude=0.01
-        )
+    for spec in make_default_specs(4):
         control_system.add_qubit(spec)
     
     print("✅ 4-qubit system initialized")
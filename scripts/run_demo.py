@@ -10,7 +10,7 @@ import logging
 # Add the src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.quantum_control.transmon_qubit import TransmonQubit, QubitSpec
+from src.quantum_control.transmon_qubit import TransmonQubit, make_default_specs
 from src.cryo_hardware.signal_chain import CryogenicControlSystem
 
 def main():
@@ -30,17 +30,7 @@ def main():
     control_system = CryogenicControlSystem()
     
     # Create qubits with realistic specs (like IBM Quantum processors)
-    qubit_specs = [
-        QubitSpec(
-            frequency=5.0 + i * 0.1,  # Different frequencies for each qubit
-            anharmonicity=-0.3,
-            t1=10000,
-            t2=5000,
-            readout_frequency=6.5 + i * 0.05,
-            readout_amplitude=0.01
-        )
-        for i in range(3)  # Create 3 qubits
-    ]
+    qubit_specs = make_default_specs(3)  # Create 3 qubits
     
     # Add qubits to control system
     for i, spec in enumerate(qubit_specs):
@@ -5,10 +5,12 @@ Verify GitHub push was successful
 import subprocess
 import sys
 
-def run_cmd(cmd):
+def run_cmd(argv):
+    """Run a command without a shell, returning (success, stdout, error)"""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        return result.returncode == 0, result.stdout, result.stderr
+        result = subprocess.run(argv, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True)
+        return result.returncode == 0, result.stdout, ""
     except Exception as e:
         return False, "", str(e)
 
@@ -16,31 +18,36 @@ def main():
     print("🔍 Verifying GitHub Push Status")
     print("=" * 40)
     
-    # Check git status
-    success, stdout, stderr = run_cmd("git status")
+    # One status call reports branch tracking, ahead/behind and HEAD commit
+    success, stdout, stderr = run_cmd(["git", "status", "--branch", "--porcelain=v2"])
     if success:
-        if "Your branch is up to date with 'origin/main'" in stdout:
+        # Header lines look like "# branch.upstream origin/main"
+        headers = {}
+        for line in stdout.split('\n'):
+            if line.startswith('# '):
+                key, _, value = line[2:].partition(' ')
+                headers[key] = value
+        
+        if (headers.get('branch.upstream') == 'origin/main'
+                and headers.get('branch.ab') == '+0 -0'):
             print("✅ Git Status: Up to date with origin/main")
         else:
             print("⚠️  Git Status: Not up to date")
             print(stdout)
+        
+        commit = headers.get('branch.oid', '')
+        if commit and commit != '(initial)':
+            print(f"✅ Last Commit: {commit[:7]}")
+        else:
+            print("❌ Failed to get last commit")
     else:
         print("❌ Git Status: Failed to check")
     
-    # Check last commit
-    success, stdout, stderr = run_cmd("git log --oneline -1")
-    if success:
-        print(f"✅ Last Commit: {stdout.strip()}")
-    else:
-        print("❌ Failed to get last commit")
-    
     # Check remote
-    success, stdout, stderr = run_cmd("git remote -v")
+    success, stdout, stderr = run_cmd(["git", "config", "--get", "remote.origin.url"])
     if success:
         print("✅ Remote configured:")
-        for line in stdout.strip().split('\n'):
-            if 'origin' in line:
-                print(f"   {line}")
+        print(f"   origin  {stdout.strip()}")
     
     print("\n🎯 GitHub Repository:")
     print("   https://github.com/jamesenglis/cryo-quantum-enterprise")
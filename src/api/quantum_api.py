@@ -3,40 +3,116 @@ REST API for quantum computer control - industry standard
 Similar to IBM Quantum Experience API
 """
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Optional
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ConfigDict, Field, conlist
+from typing import List, Dict, Literal, Optional
+from functools import lru_cache
+from types import SimpleNamespace
+import importlib.util
 import numpy as np
 import uvicorn
 from datetime import datetime
 import logging
 import sys
 import os
+import time
+
+logger = logging.getLogger(__name__)
+
+# orjson encodes the numeric payloads in C; fall back to stdlib json without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+class _DefaultResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed"""
+    
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
 
 # Add the parent directory to Python path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-try:
-    from quantum_control.transmon_qubit import TransmonQubit, QubitSpec
-    from quantum_control.two_qubit_gates import TwoQubitGate, TwoQubitGateSpec, EntanglementVerification
-    from cryo_hardware.signal_chain import CryogenicControlSystem
-    from quantum_ops.error_correction import QuantumErrorCorrection, QECCode
-    QUANTUM_IMPORTS_WORKING = True
-    print("✅ All quantum modules imported successfully")
-except ImportError as e:
-    print(f"❌ Quantum module import failed: {e}")
-    QUANTUM_IMPORTS_WORKING = False
+_QUANTUM_MODULES = (
+    'quantum_control.transmon_qubit',
+    'quantum_control.two_qubit_gates',
+    'cryo_hardware.signal_chain',
+    'quantum_ops.error_correction',
+)
+
+def _module_available(name: str) -> bool:
+    """Check a module can be found without executing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        # Parent package is missing
+        return False
+
+# Only locate the quantum modules here; they are imported by _quantum() on
+# first use so demo mode and cold starts skip the numpy/scipy stack
+_MISSING_MODULES = [m for m in _QUANTUM_MODULES if not _module_available(m)]
+QUANTUM_IMPORTS_WORKING = not _MISSING_MODULES
+if QUANTUM_IMPORTS_WORKING:
+    logger.debug("All quantum modules found")
+else:
+    logger.warning("Quantum modules not found: %s", _MISSING_MODULES)
 
 # FastAPI app
 app = FastAPI(
     title="Cryo Quantum Enterprise API",
     description="Enterprise quantum computing control API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=_DefaultResponse
 )
 
-# Global quantum system
+# Random source for demo mode measurements
+_demo_rng = np.random.default_rng()
+
+# Global quantum system, created on first use
 quantum_system = None
-if QUANTUM_IMPORTS_WORKING:
-    quantum_system = CryogenicControlSystem()
+
+def _quantum() -> SimpleNamespace:
+    """
+    Import the quantum classes on first use and cache them on the app state.
+    
+    find_spec only proves the modules exist, so an ImportError here (e.g. a
+    missing scipy) switches the API to limited mode before being re-raised.
+    """
+    global QUANTUM_IMPORTS_WORKING
+    modules = getattr(app.state, 'quantum', None)
+    if modules is None:
+        try:
+            from quantum_control.transmon_qubit import QubitSpec, make_default_specs
+            from quantum_control.two_qubit_gates import TwoQubitGate, TwoQubitGateSpec, EntanglementVerification
+            from cryo_hardware.signal_chain import CryogenicControlSystem
+            from quantum_ops.error_correction import QuantumErrorCorrection, QECCode
+        except ImportError as e:
+            QUANTUM_IMPORTS_WORKING = False
+            logger.warning("Quantum modules failed to import: %s", e)
+            raise
+        modules = SimpleNamespace(
+            QubitSpec=QubitSpec,
+            make_default_specs=make_default_specs,
+            TwoQubitGate=TwoQubitGate,
+            TwoQubitGateSpec=TwoQubitGateSpec,
+            EntanglementVerification=EntanglementVerification,
+            CryogenicControlSystem=CryogenicControlSystem,
+            QuantumErrorCorrection=QuantumErrorCorrection,
+            QECCode=QECCode
+        )
+        app.state.quantum = modules
+        logger.debug("All quantum modules imported successfully")
+    return modules
+
+def _get_system():
+    """Get the global control system, creating it on first use"""
+    global quantum_system
+    if quantum_system is None:
+        quantum_system = _quantum().CryogenicControlSystem()
+    return quantum_system
 
 class QubitCreateRequest(BaseModel):
     """Request to create a new qubit"""
@@ -55,12 +131,50 @@ class GateOperationRequest(BaseModel):
 
 class MeasurementRequest(BaseModel):
     """Request to measure qubits"""
-    qubits: List[int]
-    shots: int = 1000
+    model_config = ConfigDict(frozen=True)
+    
+    qubits: conlist(int, max_length=64)
+    shots: int = Field(1000, ge=1)
 
-def convert_complex_to_serializable(obj):
-    """Convert complex numbers and numpy arrays to JSON-serializable types"""
-    if isinstance(obj, (np.ndarray, list)):
+# (time, iso string) of the last formatted timestamp
+_TS_CACHE = [0.0, '']
+
+def _now_iso() -> str:
+    """Current time as ISO string, reformatted at most every 100 ms"""
+    t = time.time()
+    if t - _TS_CACHE[0] > 0.1:
+        # Concurrent workers may race here; timestamps are display-only
+        _TS_CACHE[:] = [t, datetime.fromtimestamp(t).isoformat()]
+    return _TS_CACHE[1]
+
+def _real_vector_to_list(arr) -> List[float]:
+    """Serialize a state known to be real, dropping the imaginary part"""
+    return np.real(arr).astype(np.float64, copy=False).tolist()
+
+def _pack_complex(arr: np.ndarray) -> List:
+    """Serialize a complex vector, using real/imag dicts only where needed"""
+    imag = arr.imag
+    if not imag.any():
+        return arr.real.tolist()
+    return [re if im == 0 else {"real": re, "imag": im}
+            for re, im in zip(arr.real.tolist(), imag.tolist())]
+
+def convert_complex_to_serializable(obj, serialize_real: bool = False):
+    """Convert complex numbers and numpy arrays to JSON-serializable types
+    
+    Pass serialize_real=True when the caller knows an array is real so the
+    imaginary part is never inspected.
+    """
+    if isinstance(obj, np.ndarray):
+        if serialize_real:
+            return _real_vector_to_list(obj)
+        if obj.ndim > 1:
+            return [convert_complex_to_serializable(row) for row in obj]
+        # The dtype is uniform, so pick the branch once for the whole vector
+        if np.iscomplexobj(obj):
+            return _pack_complex(obj)
+        return obj.tolist()
+    elif isinstance(obj, list):
         return [convert_complex_to_serializable(x) for x in obj]
     elif isinstance(obj, complex):
         # Return both real and imaginary parts, or just real if imaginary is 0
@@ -76,6 +190,31 @@ def convert_complex_to_serializable(obj):
     else:
         return obj
 
+# Only two gate types are valid, so each Bell state response is built once
+@lru_cache(maxsize=4)
+def _build_bell_response(gate_type: str, precision: str = 'fp64') -> Dict:
+    """Build the Bell state endpoint response for a supported gate type"""
+    verification = _quantum().EntanglementVerification
+    dtype = np.complex64 if precision == 'fp32' else np.complex128
+    bell_state = verification.create_bell_state(gate_type, dtype=dtype)
+    concurrence = verification.calculate_concurrence(bell_state)
+    return {
+        "bell_state_type": gate_type,
+        "concurrence": float(concurrence),
+        "entanglement_strength": "maximal" if concurrence > 0.9 else "partial",
+        # Tuple so the cached payload's nested values stay immutable
+        "state_vector": tuple(_real_vector_to_list(bell_state)),
+        "message": f"Bell state created successfully with {gate_type} gate",
+        "success": True
+    }
+
+_INVALID_GATE_RESPONSE = {
+    "error": "Invalid gate_type",
+    "message": "gate_type must be 'CNOT' or 'CZ'",
+    "valid_options": ("CNOT", "CZ"),
+    "success": False
+}
+
 @app.get("/")
 async def root():
     """API root endpoint"""
@@ -92,7 +231,7 @@ async def system_status():
     """Get quantum system status"""
     qubits_count = len(quantum_system.qubits) if quantum_system else 0
     return {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "qubits_count": qubits_count,
         "system_temperature": "15 mK",
         "status": "operational" if QUANTUM_IMPORTS_WORKING else "limited",
@@ -106,7 +245,8 @@ async def create_qubit(request: QubitCreateRequest):
         raise HTTPException(status_code=503, detail="Quantum modules not available")
     
     try:
-        spec = QubitSpec(
+        quantum_system = _get_system()
+        spec = _quantum().QubitSpec(
             frequency=request.frequency,
             anharmonicity=request.anharmonicity,
             t1=request.t1,
@@ -138,6 +278,8 @@ async def execute_gate(request: GateOperationRequest):
         raise HTTPException(status_code=503, detail="Quantum modules not available")
     
     try:
+        quantum = _quantum()
+        quantum_system = _get_system()
         if request.gate_type == 'X' and len(request.qubits) == 1:
             # Single qubit X gate
             qubit_index = request.qubits[0]
@@ -157,7 +299,7 @@ async def execute_gate(request: GateOperationRequest):
             # Two-qubit gate
             control, target = request.qubits
             
-            gate_spec = TwoQubitGateSpec(
+            gate_spec = quantum.TwoQubitGateSpec(
                 gate_type=request.gate_type,
                 control_qubit=control,
                 target_qubit=target,
@@ -166,11 +308,12 @@ async def execute_gate(request: GateOperationRequest):
                 coupling_strength=5.0
             )
             
-            gate = TwoQubitGate(gate_spec)
+            gate = quantum.TwoQubitGate(gate_spec)
             
             # For demo, create entangled state
-            entangled_state = EntanglementVerification.create_bell_state(request.gate_type)
-            concurrence = EntanglementVerification.calculate_concurrence(entangled_state)
+            verification = quantum.EntanglementVerification
+            entangled_state = verification.create_bell_state(request.gate_type)
+            concurrence = verification.calculate_concurrence(entangled_state)
             
             return {
                 "operation": f"{request.gate_type}_gate",
@@ -190,12 +333,13 @@ async def execute_gate(request: GateOperationRequest):
 async def perform_measurement(request: MeasurementRequest):
     """Perform quantum measurement"""
     if not QUANTUM_IMPORTS_WORKING:
-        # Return demo data if quantum modules aren't available
-        results = {}
-        for qubit_index in request.qubits:
-            results[f"qubit_{qubit_index}"] = {
-                "0": request.shots // 2,
-                "1": request.shots // 2,
+        # Return demo data if quantum modules aren't available, sampling
+        # all qubits' 50/50 outcomes in one draw
+        ones = _demo_rng.binomial(request.shots, 0.5, size=len(request.qubits))
+        results = {
+            f"qubit_{qubit_index}": {
+                "0": int(request.shots - one_count),
+                "1": int(one_count),
                 "readout_fidelity": 0.95,
                 "true_probability": 0.5,
                 "signal_power_4k": 0.001,
@@ -203,18 +347,22 @@ async def perform_measurement(request: MeasurementRequest):
                 "snr_improvement": 1.0,
                 "note": "demo_mode"
             }
+            for qubit_index, one_count in zip(request.qubits, ones)
+        }
         
         return {
             "measurements": results,
             "shots": request.shots,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "mode": "demo"
         }
     
     try:
+        quantum_system = _get_system()
+        n_qubits = len(quantum_system.qubits)
         results = {}
         for qubit_index in request.qubits:
-            if qubit_index >= len(quantum_system.qubits):
+            if qubit_index >= n_qubits:
                 results[f"qubit_{qubit_index}"] = {
                     "0": request.shots // 2,
                     "1": request.shots // 2,
@@ -233,7 +381,7 @@ async def perform_measurement(request: MeasurementRequest):
         return {
             "measurements": results,
             "shots": request.shots,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -250,7 +398,8 @@ async def quantum_error_correction_encode():
         }
     
     try:
-        qec = QuantumErrorCorrection(QECCode.REPETITION_CODE)
+        quantum = _quantum()
+        qec = quantum.QuantumErrorCorrection(quantum.QECCode.REPETITION_CODE)
         test_state = np.array([1, 0])  # |0⟩ state
         
         corrected_state, results = qec.run_qec_cycle(test_state)
@@ -265,60 +414,28 @@ async def quantum_error_correction_encode():
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/entanglement/bell_state")
-async def create_bell_state(gate_type: str = 'CNOT'):
+async def create_bell_state(gate_type: str = 'CNOT',
+                            precision: Literal['fp32', 'fp64'] = 'fp64'):
     """Create and verify Bell state entanglement - FIXED COMPLEX NUMBER SERIALIZATION"""
-    print(f"🔗 Entanglement endpoint called with gate_type: {gate_type}")
-    
-    try:
-        if not QUANTUM_IMPORTS_WORKING:
-            print("⚠️  Using demo mode (quantum imports not working)")
-            return {
-                "bell_state_type": gate_type,
-                "concurrence": 0.99,
-                "entanglement_strength": "maximal",
-                "state_vector": [0.707, 0.0, 0.0, 0.707],
-                "mode": "demo",
-                "message": "Demo Bell state created successfully",
-                "success": True
-            }
-        
-        print("✅ Quantum imports are working, creating real Bell state...")
-        
-        # Validate gate type
-        if gate_type not in ['CNOT', 'CZ']:
-            return {
-                "error": "Invalid gate_type",
-                "message": "gate_type must be 'CNOT' or 'CZ'",
-                "valid_options": ["CNOT", "CZ"],
-                "success": False
-            }
-        
-        print(f"Creating Bell state with {gate_type} gate...")
-        bell_state = EntanglementVerification.create_bell_state(gate_type)
-        print(f"Bell state created (type: {type(bell_state)}, length: {len(bell_state)})")
-        
-        concurrence = EntanglementVerification.calculate_concurrence(bell_state)
-        print(f"Concurrence calculated: {concurrence}")
-        
-        # Convert to JSON-serializable format using our helper function
-        state_vector = convert_complex_to_serializable(bell_state)
-        print(f"State vector serialized: {state_vector}")
-        
-        print("✅ Returning successful entanglement response")
+    if not QUANTUM_IMPORTS_WORKING:
         return {
             "bell_state_type": gate_type,
-            "concurrence": float(concurrence),
-            "entanglement_strength": "maximal" if concurrence > 0.9 else "partial",
-            "state_vector": state_vector,
-            "message": f"Bell state created successfully with {gate_type} gate",
+            "concurrence": 0.99,
+            "entanglement_strength": "maximal",
+            "state_vector": [0.707, 0.0, 0.0, 0.707],
+            "mode": "demo",
+            "message": "Demo Bell state created successfully",
             "success": True
         }
-        
+    
+    if gate_type not in ('CNOT', 'CZ'):
+        return dict(_INVALID_GATE_RESPONSE)
+    try:
+        # Shallow copy: callers can't mutate the cached response
+        return dict(_build_bell_response(gate_type, precision))
     except Exception as e:
         error_msg = f"Entanglement creation failed: {str(e)}"
-        print(f"❌ ERROR in entanglement endpoint: {error_msg}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in entanglement endpoint: %s", error_msg)
         return {
             "error": "Internal server error",
             "message": error_msg,
@@ -329,13 +446,20 @@ async def create_bell_state(gate_type: str = 'CNOT'):
 @app.on_event("startup")
 async def startup_event():
     """Initialize quantum system with demo qubits on startup"""
-    if QUANTUM_IMPORTS_WORKING and quantum_system:
-        for i in range(3):
-            spec = QubitSpec(5.0 + i * 0.1, -0.3, 10000, 5000, 6.5 + i * 0.05, 0.01)
-            quantum_system.add_qubit(spec)
-        print("✅ Quantum system initialized with 3 demo qubits")
+    if QUANTUM_IMPORTS_WORKING:
+        try:
+            quantum_system = _get_system()
+        except ImportError:
+            # _quantum() has already switched the API to limited mode
+            logger.warning("Running in limited mode - quantum modules failed to import")
+            return
+        # Skip if a reload or test already populated the global system
+        if not quantum_system.qubits:
+            for spec in _quantum().make_default_specs(3):
+                quantum_system.add_qubit(spec)
+        logger.debug("Quantum system initialized with %d qubits", len(quantum_system.qubits))
     else:
-        print("⚠️  Running in limited mode - quantum modules not available")
+        logger.warning("Running in limited mode - quantum modules not available")
 
 if __name__ == "__main__":
     # Start the API server
@@ -3,12 +3,73 @@ Industry-standard transmon qubit implementation.
 Models real quantum processor behavior at cryogenic temperatures.
 """
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
+import math
+import sys
 import numpy as np
-from scipy.linalg import expm
 import logging
 
-@dataclass
+try:
+    import numba
+except ImportError:
+    numba = None
+
+@lru_cache(maxsize=64)
+def _time_axis(duration: float, dtype=np.float32) -> np.ndarray:
+    """Shared read-only sample times for a waveform at 10 GS/s"""
+    t = np.linspace(0, duration, int(duration * 10), dtype=dtype)
+    t.setflags(write=False)
+    return t
+
+def _drag_kernel(duration, amplitude, beta, sigma, I_out, Q_out):
+    """Fill I_out/Q_out with a DRAG pulse in one fused pass over the samples"""
+    n = I_out.shape[0]
+    step = duration / (n - 1) if n > 1 else 0.0
+    center = duration / 2
+    inv = 1.0 / (sigma * duration)
+    for i in range(n):
+        offset = i * step - center
+        x = offset * inv
+        envelope = amplitude * math.exp(-0.5 * x * x)
+        I_out[i] = envelope
+        Q_out[i] = -beta * offset * inv * inv * envelope
+
+if numba is not None:
+    # Compiled once and cached on disk; without numba the numpy path is used
+    _drag_kernel = numba.njit(cache=True, fastmath=True)(_drag_kernel)
+
+@lru_cache(maxsize=128)
+def _drag_pulse(duration: float, amplitude: float,
+                beta: float, sigma: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Build a read-only (I, Q) DRAG pulse; shared by every qubit asking for it"""
+    n_samples = int(duration * 10)  # 10 GS/s sampling
+    if numba is not None:
+        I_component = np.empty(n_samples, dtype=np.float32)
+        Q_component = np.empty(n_samples, dtype=np.float32)
+        _drag_kernel(duration, amplitude, beta, sigma, I_component, Q_component)
+    else:
+        t = _time_axis(duration)
+        center = duration / 2
+        
+        # Gaussian envelope
+        envelope = amplitude * np.exp(-0.5 * ((t - center) / (sigma * duration)) ** 2)
+        
+        # DRAG correction (derivative of Gaussian)
+        derivative = -beta * (t - center) / (sigma * duration) ** 2 * envelope
+        
+        # I and Q components for IQ mixer
+        I_component = envelope
+        Q_component = derivative
+    
+    I_component.setflags(write=False)
+    Q_component.setflags(write=False)
+    return I_component, Q_component
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get plain instances
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_SLOTS)
 class QubitSpec:
     """Qubit specification following industry standards"""
     frequency: float  # GHz
@@ -18,6 +79,37 @@ class QubitSpec:
     readout_frequency: float  # GHz
     readout_amplitude: float  # V
 
+# One row per simulate_measurement call
+MEASUREMENT_DTYPE = np.dtype([
+    ('zeros', 'i4'),
+    ('ones', 'i4'),
+    ('fidelity', 'f4'),
+    ('p_true', 'f4'),
+])
+
+@lru_cache(maxsize=None)
+def make_default_specs(n: int, base: float = 5.0, step: float = 0.1,
+                       ro_base: float = 6.5, ro_step: float = 0.05) -> Tuple[QubitSpec, ...]:
+    """
+    Build specs for n demo qubits with evenly spaced qubit and readout frequencies.
+    
+    Results are cached, so repeated calls return the same tuple.
+    """
+    index = np.arange(n)
+    freqs = (base + step * index).tolist()
+    readout_freqs = (ro_base + ro_step * index).tolist()
+    return tuple(
+        QubitSpec(
+            frequency=freq,
+            anharmonicity=-0.3,
+            t1=10000,
+            t2=5000,
+            readout_frequency=readout_freq,
+            readout_amplitude=0.01
+        )
+        for freq, readout_freq in zip(freqs, readout_freqs)
+    )
+
 class TransmonQubit:
     """
     Industry-standard transmon qubit implementation.
@@ -29,13 +121,21 @@ class TransmonQubit:
         self.temperature = temperature  # Kelvin (typical fridge temp)
         self.logger = logging.getLogger(__name__)
         self._state = np.array([1.0, 0.0], dtype=complex)  # |0⟩ state
-        self._measurement_results = []
+        # Measurement history as columns; only the first _n_results rows are valid
+        self._measurement_results = np.empty(0, dtype=MEASUREMENT_DTYPE)
+        self._n_results = 0
+        self._rng = np.random.default_rng()
         
     @property
     def state(self) -> np.ndarray:
         """Get current quantum state"""
         return self._state.copy()
     
+    @property
+    def measurement_history(self) -> np.ndarray:
+        """Structured array of past measurements (zeros, ones, fidelity, p_true)"""
+        return self._measurement_results[:self._n_results]
+    
     def generate_drag_pulse(self, duration: float, amplitude: float, 
                           beta: float = 0.5, sigma: float = 0.25) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -48,22 +148,10 @@ class TransmonQubit:
             sigma: Gaussian width parameter
             
         Returns:
-            Tuple of (I, Q) components for IQ mixer
+            Tuple of (I, Q) float32 components for IQ mixer. Pulses are
+            cached by parameters, so the arrays are shared and read-only.
         """
-        t = np.linspace(0, duration, int(duration * 10))  # 10 GS/s sampling
-        center = duration / 2
-        
-        # Gaussian envelope
-        envelope = amplitude * np.exp(-0.5 * ((t - center) / (sigma * duration)) ** 2)
-        
-        # DRAG correction (derivative of Gaussian)
-        derivative = -beta * (t - center) / (sigma * duration) ** 2 * envelope
-        
-        # I and Q components for IQ mixer
-        I_component = envelope
-        Q_component = derivative
-        
-        return I_component, Q_component
+        return _drag_pulse(duration, amplitude, beta, sigma)
     
     def apply_x_gate(self, duration: float = 20.0) -> None:
         """Apply X gate (π pulse) using DRAG waveform"""
@@ -87,31 +175,42 @@ class TransmonQubit:
         Returns:
             Dictionary with measurement results
         """
-        # Probability of |1⟩ state
-        p1 = np.abs(self._state[1]) ** 2
+        # Probability of |1⟩ state, as a plain float for the scalar math below
+        amp1 = complex(self._state[1])
+        p1 = amp1.real * amp1.real + amp1.imag * amp1.imag
         
         # Add cryogenic readout noise (typical amplifier performance)
         readout_fidelity = 0.95
         p1_measured = p1 * readout_fidelity + (1 - p1) * (1 - readout_fidelity)
         
-        # Generate measurement results
-        measurements = np.random.binomial(1, p1_measured, shots)
+        # Count |1⟩ outcomes directly instead of sampling each shot
+        ones = int(self._rng.binomial(shots, p1_measured))
         
         results = {
-            '0': int(np.sum(measurements == 0)),
-            '1': int(np.sum(measurements == 1)),
+            '0': shots - ones,
+            '1': ones,
             'readout_fidelity': readout_fidelity,
             'true_probability': p1
         }
         
-        self._measurement_results.append(results)
+        self._record_measurement(shots - ones, ones, readout_fidelity, p1)
         return results
     
-    def get_state_probabilities(self) -> Dict[str, float]:
-        """Get probabilities of |0⟩ and |1⟩ states"""
-        p0 = np.abs(self._state[0]) ** 2
-        p1 = np.abs(self._state[1]) ** 2
-        return {'|0⟩': p0, '|1⟩': p1}
+    def _record_measurement(self, zeros: int, ones: int,
+                            fidelity: float, p_true: float) -> None:
+        """Append a row to the measurement history, doubling capacity when full"""
+        idx = self._n_results
+        if idx >= self._measurement_results.size:
+            grown = np.empty(max(16, 2 * self._measurement_results.size),
+                             dtype=MEASUREMENT_DTYPE)
+            grown[:idx] = self._measurement_results[:idx]
+            self._measurement_results = grown
+        self._measurement_results[idx] = (zeros, ones, fidelity, p_true)
+        self._n_results = idx + 1
+    
+    def get_state_probabilities(self) -> np.ndarray:
+        """Get probabilities of |0⟩ and |1⟩ states as a [p0, p1] array"""
+        return np.abs(self._state) ** 2
 
 # Example usage
 if __name__ == "__main__":
@@ -2,9 +2,12 @@
 Quantum Error Correction - industry standard codes
 Implements surface code, repetition code like Google/IBM
 """
+import math
 import numpy as np
+from scipy import sparse
 from typing import List, Dict, Tuple, Any
 from enum import Enum
+from dataclasses import dataclass
 import logging
 
 class QECCode(Enum):
@@ -14,6 +17,12 @@ class QECCode(Enum):
     SHOR_CODE = "shor_code"
     STEANE_CODE = "steane_code"
 
+@dataclass
+class SyndromeResult:
+    """Surface code stabilizer outcomes (+1/-1), one int8 entry per stabilizer"""
+    x: np.ndarray
+    z: np.ndarray
+
 class SurfaceCode:
     """
     Surface Code implementation - industry standard for fault tolerance
@@ -24,46 +33,45 @@ class SurfaceCode:
         self.distance = distance
         self.logger = logging.getLogger(__name__)
         self.measurement_results = []
+        self._rng = np.random.default_rng()
+        # Each logical amplitude is spread uniformly over a block of 2**distance
+        self._block = 2**distance
+        self._inv_sqrt = 1.0 / math.sqrt(self._block)
         
     def encode_logical_qubit(self, state: np.ndarray) -> np.ndarray:
         """
         Encode a logical qubit using surface code
         """
-        # Simplified surface code encoding
-        logical_state = np.kron(state, np.ones(2**self.distance) / np.sqrt(2**self.distance))
+        # Simplified surface code encoding: state ⊗ uniform block, filled
+        # directly instead of going through np.kron
+        block = self._block
+        logical_state = np.empty(2 * block, dtype=np.result_type(state, float))
+        logical_state[:block] = state[0] * self._inv_sqrt
+        logical_state[block:] = state[1] * self._inv_sqrt
         self.logger.info(f"Encoded logical qubit with distance {self.distance}")
         return logical_state
     
-    def measure_stabilizers(self, state: np.ndarray) -> Dict[str, int]:
+    def measure_stabilizers(self, state: np.ndarray) -> SyndromeResult:
         """
         Measure surface code stabilizers - detect errors
         """
-        stabilizer_results = {}
-        
-        for i in range(self.distance - 1):
-            # Simulate X and Z stabilizer measurements
-            stabilizer_results[f'X_{i}'] = np.random.choice([+1, -1], p=[0.95, 0.05])
-            stabilizer_results[f'Z_{i}'] = np.random.choice([+1, -1], p=[0.95, 0.05])
+        # Simulate all X and Z stabilizer measurements in one draw,
+        # each flipping to -1 with 5% probability
+        flips = self._rng.random((2, self.distance - 1)) < 0.05
+        values = np.where(flips, -1, 1).astype(np.int8)
+        stabilizer_results = SyndromeResult(x=values[0], z=values[1])
         
         self.measurement_results.append(stabilizer_results)
         return stabilizer_results
     
-    def detect_errors(self, stabilizer_results: Dict[str, int]) -> List[Tuple[int, int]]:
+    def detect_errors(self, stabilizer_results: SyndromeResult) -> List[Tuple[int, int]]:
         """
         Detect errors from stabilizer measurements
         """
-        errors = []
-        
-        for stabilizer, value in stabilizer_results.items():
-            if value == -1:  # -1 indicates error
-                if stabilizer.startswith('X_'):
-                    idx = int(stabilizer[2:])
-                    errors.append((idx, 0))
-                elif stabilizer.startswith('Z_'):
-                    idx = int(stabilizer[2:])
-                    errors.append((0, idx))
-        
-        return errors
+        # -1 indicates error
+        x_errors = np.flatnonzero(stabilizer_results.x == -1).tolist()
+        z_errors = np.flatnonzero(stabilizer_results.z == -1).tolist()
+        return [(idx, 0) for idx in x_errors] + [(0, idx) for idx in z_errors]
     
     def correct_errors(self, state: np.ndarray, errors: List[Tuple[int, int]]) -> np.ndarray:
         """
@@ -83,42 +91,35 @@ class RepetitionCode:
     
     def __init__(self, repetitions: int = 3):
         self.repetitions = repetitions
+        self.logger = logging.getLogger(__name__)
+        self._rng = np.random.default_rng()
         
-    def encode_logical_qubit(self, state: np.ndarray) -> np.ndarray:
-        """Encode using repetition code - FIXED METHOD NAME"""
-        if state[0] == 1:  # |0⟩ state
-            encoded = np.array([1] + [0]*(2**self.repetitions - 1))
-        else:  # |1⟩ state
-            encoded = np.array([0]*(2**self.repetitions - 1) + [1])
-        return encoded
+    def encode_logical_qubit(self, state: np.ndarray) -> sparse.csc_matrix:
+        """
+        Encode using repetition code - FIXED METHOD NAME
+        
+        The encoded basis state has a single nonzero amplitude, so it is
+        returned as a sparse (2**repetitions, 1) column vector. CSC keeps
+        storage independent of the dimension for a single column.
+        """
+        dim = 2**self.repetitions
+        index = 0 if state[0] == 1 else dim - 1  # |0...0⟩ or |1...1⟩
+        return sparse.csc_matrix(([1], ([index], [0])), shape=(dim, 1))
     
-    def measure_stabilizers(self, state: np.ndarray) -> Dict[str, int]:
-        """Measure repetition code stabilizers"""
-        # For repetition code, measure each physical qubit
-        measurements = {}
-        for i in range(self.repetitions):
-            # Simulate measurement with 95% accuracy
-            measurements[f'qubit_{i}'] = np.random.choice([0, 1], p=[0.95, 0.05])
-        return measurements
+    def measure_stabilizers(self, state: np.ndarray) -> np.ndarray:
+        """Measure repetition code stabilizers, returning one int8 bit per qubit"""
+        # For repetition code, measure each physical qubit with 95% accuracy
+        return (self._rng.random(self.repetitions) < 0.05).astype(np.int8)
     
-    def detect_errors(self, measurements: Dict[str, int]) -> List[int]:
+    def detect_errors(self, measurements: np.ndarray) -> List[int]:
         """Detect errors in repetition code"""
-        errors = []
-        qubit_values = [measurements[f'qubit_{i}'] for i in range(self.repetitions)]
-        
         # Simple majority voting error detection
-        majority = 1 if sum(qubit_values) > len(qubit_values) / 2 else 0
-        
-        for i, value in enumerate(qubit_values):
-            if value != majority:
-                errors.append(i)
-        
-        return errors
+        majority = int(np.count_nonzero(measurements) * 2 > measurements.size)
+        return np.flatnonzero(measurements != majority).tolist()
     
     def correct_errors(self, state: np.ndarray, errors: List[int]) -> np.ndarray:
         """Correct errors in repetition code"""
-        if errors:
-            self.logger = logging.getLogger(__name__)
+        if errors and self.logger.isEnabledFor(logging.INFO):
             self.logger.info(f"Correcting {len(errors)} bit-flip errors")
         return state
 
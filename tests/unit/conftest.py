@@ -0,0 +1,48 @@
+"""
+Shared fixtures for unit tests.
+Expensive objects are built once per session and deep-copied per test.
+"""
+import copy
+import pytest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
+
+from quantum_control.transmon_qubit import TransmonQubit, QubitSpec
+from cryo_hardware.signal_chain import CryogenicControlSystem
+
+@pytest.fixture(scope="session")
+def qubit_spec():
+    """Typical transmon spec used across tests"""
+    return QubitSpec(
+        frequency=5.0,
+        anharmonicity=-0.3,
+        t1=10000,
+        t2=5000,
+        readout_frequency=6.5,
+        readout_amplitude=0.01
+    )
+
+@pytest.fixture(scope="session")
+def _pristine_qubit(qubit_spec):
+    """Template qubit, never handed to tests directly"""
+    return TransmonQubit(qubit_spec)
+
+@pytest.fixture
+def qubit(_pristine_qubit):
+    """Fresh qubit in |0⟩ for each test"""
+    return copy.deepcopy(_pristine_qubit)
+
+@pytest.fixture(scope="session")
+def _pristine_control_system(qubit_spec):
+    """Template control system with one qubit added"""
+    control_system = CryogenicControlSystem()
+    control_system.add_qubit(qubit_spec)
+    return control_system
+
+@pytest.fixture
+def control_system(_pristine_control_system):
+    """Fresh control system with one qubit for each test"""
+    return copy.deepcopy(_pristine_control_system)
@@ -10,7 +10,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
 from quantum_ops.error_correction import (
     QuantumErrorCorrection, QECCode, 
-    SurfaceCode, RepetitionCode
+    SurfaceCode, RepetitionCode, SyndromeResult
 )
 
 class TestQuantumErrorCorrection:
@@ -43,6 +43,40 @@ class TestQuantumErrorCorrection:
         encoded_state = rep_code.encode_logical_qubit(test_state)
         assert encoded_state.shape[0] == 2**3  # Check encoding size
     
+    def test_repetition_code_encoding_is_sparse(self):
+        """Test repetition code stores only the encoded basis amplitude"""
+        rep_code = RepetitionCode(repetitions=3)
+        
+        encoded_zero = rep_code.encode_logical_qubit(np.array([1, 0]))
+        encoded_one = rep_code.encode_logical_qubit(np.array([0, 1]))
+        assert encoded_zero.nnz == 1
+        assert encoded_zero.toarray()[0, 0] == 1
+        assert encoded_one.toarray()[-1, 0] == 1
+    
+    def test_surface_code_syndrome_arrays(self):
+        """Test stabilizer outcomes are +/-1 arrays, one per stabilizer"""
+        surface_code = SurfaceCode(distance=3)
+        syndrome = surface_code.measure_stabilizers(np.array([1, 0]))
+        
+        assert isinstance(syndrome, SyndromeResult)
+        assert syndrome.x.shape == syndrome.z.shape == (2,)
+        assert set(np.unique(np.concatenate([syndrome.x, syndrome.z]))) <= {-1, 1}
+    
+    def test_surface_code_detect_errors(self):
+        """Test -1 stabilizers are reported as X and Z errors"""
+        surface_code = SurfaceCode(distance=3)
+        syndrome = SyndromeResult(x=np.array([1, -1], dtype=np.int8),
+                                  z=np.array([-1, 1], dtype=np.int8))
+        
+        assert surface_code.detect_errors(syndrome) == [(1, 0), (0, 0)]
+    
+    def test_repetition_code_majority_vote(self):
+        """Test qubits disagreeing with the majority are flagged"""
+        rep_code = RepetitionCode(repetitions=3)
+        
+        assert rep_code.detect_errors(np.array([0, 1, 0], dtype=np.int8)) == [1]
+        assert rep_code.detect_errors(np.array([1, 1, 0], dtype=np.int8)) == [2]
+    
     def test_qec_surface_code_cycle(self):
         """Test full QEC cycle with surface code"""
         qec = QuantumErrorCorrection(QECCode.SURFACE_CODE)
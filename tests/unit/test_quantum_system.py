@@ -7,83 +7,113 @@ import numpy as np
 import sys
 import os
 
-# Add src to path
+# Add src to path (fixtures live in conftest.py)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../src'))
 
-from quantum_control.transmon_qubit import TransmonQubit, QubitSpec
-from cryo_hardware.signal_chain import CryogenicControlSystem, AmplifierSpec, TemperatureStage
+from quantum_control.two_qubit_gates import EntanglementVerification
 
 class TestTransmonQubit:
     """Test transmon qubit functionality"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.qubit_spec = QubitSpec(
-            frequency=5.0,
-            anharmonicity=-0.3,
-            t1=10000,
-            t2=5000,
-            readout_frequency=6.5,
-            readout_amplitude=0.01
-        )
-        self.qubit = TransmonQubit(self.qubit_spec)
-    
-    def test_initial_state(self):
+    def test_initial_state(self, qubit):
         """Test qubit initializes in |0⟩ state"""
-        probs = self.qubit.get_state_probabilities()
-        assert probs['|0⟩'] == 1.0
-        assert probs['|1⟩'] == 0.0
+        probs = qubit.get_state_probabilities()
+        np.testing.assert_allclose(probs, [1.0, 0.0], atol=1e-12)
     
-    def test_x_gate(self):
+    def test_x_gate(self, qubit):
         """Test X gate functionality"""
-        self.qubit.apply_x_gate()
-        probs = self.qubit.get_state_probabilities()
-        assert probs['|1⟩'] == 1.0
+        qubit.apply_x_gate()
+        probs = qubit.get_state_probabilities()
+        np.testing.assert_allclose(probs[1], 1.0, atol=1e-12)
     
-    def test_drag_pulse_generation(self):
+    def test_drag_pulse_generation(self, qubit):
         """Test DRAG pulse generation"""
-        I, Q = self.qubit.generate_drag_pulse(duration=20.0, amplitude=0.1)
+        I, Q = qubit.generate_drag_pulse(duration=20.0, amplitude=0.1)
         assert len(I) == len(Q)
         assert I.shape == Q.shape
         assert np.max(I) > 0  # Should have non-zero amplitude
     
-    def test_measurement_statistics(self):
+    def test_drag_pulse_cached(self, qubit):
+        """Test repeated DRAG pulses share one read-only array"""
+        I, Q = qubit.generate_drag_pulse(duration=20.0, amplitude=0.1)
+        I2, Q2 = qubit.generate_drag_pulse(duration=20.0, amplitude=0.1)
+        assert I is I2 and Q is Q2
+        assert not I.flags.writeable
+    
+    @pytest.mark.parametrize("shots", [100, 1000, 10000])
+    def test_measurement_statistics(self, qubit, shots):
         """Test measurement produces valid statistics"""
-        results = self.qubit.simulate_measurement(shots=1000)
+        results = qubit.simulate_measurement(shots=shots)
         assert '0' in results
         assert '1' in results
-        assert results['0'] + results['1'] == 1000
+        assert results['0'] + results['1'] == shots
+        # |0⟩ reads as 1 only through the 5% readout error; allow 5 sigma
+        p_error = 0.05
+        sigma = np.sqrt(p_error * (1 - p_error) / shots)
+        assert abs(results['1'] / shots - p_error) < 5 * sigma
+    
+    def test_measurement_history(self, qubit):
+        """Test measurements are recorded across capacity growth"""
+        for _ in range(20):
+            qubit.simulate_measurement(shots=100)
+        history = qubit.measurement_history
+        assert history.shape == (20,)
+        assert np.all(history['zeros'] + history['ones'] == 100)
 
 class TestCryogenicSystem:
     """Test cryogenic control system"""
     
-    def setup_method(self):
-        """Setup test fixtures"""
-        self.control_system = CryogenicControlSystem()
-        
-        # Add a test qubit
-        qubit_spec = QubitSpec(
-            frequency=5.0,
-            anharmonicity=-0.3,
-            t1=10000,
-            t2=5000,
-            readout_frequency=6.5,
-            readout_amplitude=0.01
-        )
-        self.qubit = self.control_system.add_qubit(qubit_spec)
-    
-    def test_qubit_addition(self):
+    def test_qubit_addition(self, control_system, qubit_spec):
         """Test adding qubits to control system"""
-        assert len(self.control_system.qubits) == 1
-        assert self.control_system.qubits[0] == self.qubit
+        assert len(control_system.qubits) == 1
+        assert control_system.qubits[0].spec == qubit_spec
+    
+    def test_add_qubit_returns_appended_qubit(self, control_system, qubit_spec):
+        """Test add_qubit returns the qubit it appended"""
+        qubit = control_system.add_qubit(qubit_spec)
+        assert qubit is control_system.qubits[-1]
+        assert len(control_system.qubits) == 2
     
-    def test_readout_chain(self):
+    def test_readout_chain(self, control_system):
         """Test complete readout chain"""
-        results = self.control_system.run_readout(0, shots=100)
+        results = control_system.run_readout(0, shots=100)
         assert '0' in results
         assert '1' in results
         assert 'snr_improvement' in results
         assert results['snr_improvement'] > 0
+        # Plain floats, so the results stay JSON serializable
+        for key in ('signal_power_4k', 'signal_power_mxc', 'snr_improvement'):
+            assert type(results[key]) is float
+    
+    def test_readout_large_shots(self, control_system):
+        """Test large shot counts keep exact counts with a single noise pass"""
+        results = control_system.run_readout(0, shots=50000)
+        assert results['0'] + results['1'] == 50000
+        assert results['signal_power_mxc'] > 0
+    
+    def test_readout_noise_shots(self, control_system):
+        """Test opting in to a batch of independently noised readouts"""
+        results = control_system.run_readout(0, shots=100, noise_shots=8)
+        assert results['0'] + results['1'] == 100
+        assert results['signal_power_mxc'] > 0
+    
+    def test_system_noise_temperature(self, control_system):
+        """Test Friis cascade is dominated by the first amplifier"""
+        results = control_system.run_readout(0, shots=10)
+        # 2 K first stage, 5 K second stage behind 35 dB of gain
+        assert results['system_noise_temperature'] == pytest.approx(2.0 + 5.0 / 10**3.5)
+
+class TestEntanglement:
+    """Test Bell state generation"""
+    
+    @pytest.mark.parametrize("gate_type, concurrence", [("CNOT", 1.0), ("CZ", 0.25)])
+    def test_bell_state(self, gate_type, concurrence):
+        """Test cached Bell states are normalized and match a fresh computation"""
+        state = EntanglementVerification.create_bell_state(gate_type)
+        assert np.isclose(np.vdot(state, state).real, 1.0)
+        assert EntanglementVerification.calculate_concurrence(state) == pytest.approx(concurrence)
+        # A copy bypasses the cache and takes the computed path
+        assert EntanglementVerification.calculate_concurrence(state.copy()) == pytest.approx(concurrence)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
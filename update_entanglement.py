@@ -1,48 +1,54 @@
 """
 Update the entanglement endpoint in the API file
 """
+import mmap
 import re
 
-# Read the current API file
-with open('src/api/quantum_api.py', 'r') as f:
-    content = f.read()
+API_PATH = 'src/api/quantum_api.py'
 
-# Find and replace the entanglement endpoint
-old_entanglement = '''@app.get("/entanglement/bell_state")
-async def create_bell_state(gate_type: str = 'CNOT'):
-    """Create and verify Bell state entanglement"""
-    if not QUANTUM_IMPORTS_WORKING:
-        # Return demo Bell state data
-        return {
-            "bell_state_type": gate_type,
-            "concurrence": 0.99,
-            "entanglement_strength": "maximal",
-            "state_vector": [0.707, 0.0, 0.0, 0.707],
-            "mode": "demo"
-        }
+new_entanglement = '''from fastapi import Response
+
+# Demo responses never change, so render them to JSON bytes once
+_DEMO_BELL_BYTES = {
+    gt: _DefaultResponse({
+        "bell_state_type": gt,
+        "concurrence": 0.99,
+        "entanglement_strength": "maximal",
+        "state_vector": [0.707, 0.0, 0.0, 0.707],
+        "mode": "demo"
+    }).body
+    for gt in ('CNOT', 'CZ')
+}
+
+# Only two gate types are valid, so each response is built once
+@lru_cache(maxsize=None)
+def _bell(gate_type: str) -> bytes:
+    """Render the Bell state response for a supported gate type to JSON bytes"""
+    verification = _quantum().EntanglementVerification
+    bell_state = verification.create_bell_state(gate_type)
+    concurrence = float(verification.calculate_concurrence(bell_state))
     
-    try:
-        bell_state = EntanglementVerification.create_bell_state(gate_type)
-        concurrence = EntanglementVerification.calculate_concurrence(bell_state)
-        
-        # Convert to Python native types for JSON serialization
-        state_list = [float(x.real) for x in bell_state]  # Just take real parts
-        
-        return {
-            "bell_state_type": gate_type,
-            "concurrence": float(concurrence),
-            "entanglement_strength": "maximal" if concurrence > 0.9 else "partial",
-            "state_vector": state_list
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Entanglement creation failed: {str(e)}")'''
+    # Convert to Python native types for JSON serialization in one numpy pass
+    arr = np.ascontiguousarray(bell_state)
+    state_list = arr.real.tolist() if np.iscomplexobj(arr) else arr.astype(float).tolist()
+    
+    return _DefaultResponse({
+        "bell_state_type": gate_type,
+        "concurrence": concurrence,
+        "entanglement_strength": ("partial", "maximal")[int(concurrence > 0.9)],
+        "state_vector": state_list,
+        "message": f"Bell state created successfully with {gate_type} gate"
+    }).body
 
-new_entanglement = '''@app.get("/entanglement/bell_state")
+@app.get("/entanglement/bell_state")
 async def create_bell_state(gate_type: str = 'CNOT'):
     """Create and verify Bell state entanglement - ROBUST VERSION"""
     try:
         if not QUANTUM_IMPORTS_WORKING:
-            # Return demo Bell state data
+            # Return demo Bell state data, pre-rendered for the known gates
+            demo = _DEMO_BELL_BYTES.get(gate_type)
+            if demo is not None:
+                return Response(content=demo, media_type="application/json")
             return {
                 "bell_state_type": gate_type,
                 "concurrence": 0.99,
@@ -52,29 +58,11 @@ async def create_bell_state(gate_type: str = 'CNOT'):
             }
         
         # Validate gate type
-        if gate_type not in ['CNOT', 'CZ']:
+        if gate_type not in ('CNOT', 'CZ'):
             raise HTTPException(status_code=400, detail="gate_type must be 'CNOT' or 'CZ'")
         
-        bell_state = EntanglementVerification.create_bell_state(gate_type)
-        concurrence = EntanglementVerification.calculate_concurrence(bell_state)
-        
-        # Convert to Python native types for JSON serialization
-        state_list = []
-        for x in bell_state:
-            if isinstance(x, (int, float)):
-                state_list.append(float(x))
-            elif hasattr(x, 'real'):
-                state_list.append(float(x.real))
-            else:
-                state_list.append(float(x))
-        
-        return {
-            "bell_state_type": gate_type,
-            "concurrence": float(concurrence),
-            "entanglement_strength": "maximal" if concurrence > 0.9 else "partial",
-            "state_vector": state_list,
-            "message": f"Bell state created successfully with {gate_type} gate"
-        }
+        # Serve the pre-rendered bytes as-is; FastAPI does no encoding
+        return Response(content=_bell(gate_type), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -83,15 +71,37 @@ async def create_bell_state(gate_type: str = 'CNOT'):
         print(f"Entanglement error: {error_detail}")
         raise HTTPException(status_code=500, detail=error_detail)'''
 
-# Replace the content
-if old_entanglement in content:
-    content = content.replace(old_entanglement, new_entanglement)
-    print("✅ Updated entanglement endpoint")
-else:
-    print("❌ Could not find the entanglement endpoint to update")
+# Match the whole endpoint (and the helpers a previous run put in front
+# of it) up to the next top-level statement
+pattern = re.compile(
+    rb'(?:(?:from fastapi import Response\n\n# Demo responses never change'
+    rb'|# Only two gate types are valid, so each response is built once\n).*?)?'
+    rb'@app\.get\("/entanglement/bell_state"\)\s*\nasync def create_bell_state.*?'
+    rb'(?=\n\S|\Z)',
+    re.DOTALL
+)
+new_bytes = (new_entanglement + '\n').encode('utf-8')
 
-# Write the updated content
-with open('src/api/quantum_api.py', 'w') as f:
-    f.write(content)
+# Search the API file through a read-only mmap rather than reading it into a str
+with open(API_PATH, 'rb') as f:
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        match = pattern.search(mm)
+        if match is None:
+            content = None
+        elif match.group() == new_bytes:
+            content = b''  # Already up to date
+        else:
+            content = mm[:match.start()] + new_bytes + mm[match.end():]
 
-print("✅ API file updated")
+if content is None:
+    print("❌ Could not find the entanglement endpoint to update")
+elif not content:
+    print("✅ Entanglement endpoint already up to date")
+else:
+    print("✅ Updated entanglement endpoint")
+    
+    # Only rewrite the file when the endpoint actually changed
+    with open(API_PATH, 'wb') as f:
+        f.write(content)
+    
+    print("✅ API file updated")
@@ -3,18 +3,27 @@
 Enterprise Dependency Verification Script
 """
 import importlib
+import importlib.metadata
+import importlib.util
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 def check_package(package_name, import_name=None):
+    """Check a package is installed, returning (ok, status line) so callers control output order"""
     name = import_name or package_name
     try:
-        module = importlib.import_module(name)
-        version = getattr(module, '__version__', 'Unknown version')
-        print(f"✅ {package_name:20} {version:15} - OK")
-        return True
+        # Locate the package and read its version from installed metadata
+        # without running its __init__ (jax/matplotlib imports are slow)
+        if importlib.util.find_spec(name) is None:
+            raise ImportError(f"No module named '{name}'")
+        try:
+            version = importlib.metadata.version(package_name)
+        except importlib.metadata.PackageNotFoundError:
+            module = importlib.import_module(name)
+            version = getattr(module, '__version__', 'Unknown version')
+        return True, f"✅ {package_name:20} {version:15} - OK"
     except ImportError as e:
-        print(f"❌ {package_name:20} {'':15} - FAILED: {e}")
-        return False
+        return False, f"❌ {package_name:20} {'':15} - FAILED: {e}"
 
 def main():
     print("🔬 Verifying Enterprise Quantum Computing Stack")
@@ -32,7 +41,13 @@ def main():
         ("pytest", "pytest"),
     ]
     
-    success = all(check_package(*pkg) for pkg in packages)
+    # Checks are mostly disk I/O, so overlap them; map keeps the list order
+    with ThreadPoolExecutor(max_workers=len(packages)) as executor:
+        results = list(executor.map(lambda pkg: check_package(*pkg), packages))
+    
+    # One write for the whole report instead of a print per package
+    sys.stdout.write("\n".join(line for _, line in results) + "\n")
+    success = all(ok for ok, _ in results)
     
     if success:
         print("\n🎉 ALL DEPENDENCIES INSTALLED SUCCESSFULLY!")